@@ -2,32 +2,242 @@ import asyncio
 import httpx
 import pandas as pd
 from typing import List, Dict, Any, Optional, Set
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import logging
 from models import (
     BenchmarkEntry, ModelInfo, EvaluationResult, TaskType, MetricType,
     ModelFamily, ModelSize, BenchmarkSummary, TaskStats, DatasetStats,
     ModelFamilyStats, TrendData, CorrelationMatrix, Leaderboard, LeaderboardEntry
 )
-import json
+import hashlib
+import heapq
+import math
 import re
-import json
-from collections import defaultdict
+import time
+from pathlib import Path
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+import ahocorasick
+import ijson
+import orjson
 import numpy as np
-from datetime import timezone
-import aiohttp
-from typing import Dict, Any, List, Optional, Tuple
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# SOTA tables change at most daily, so cached responses stay fresh for an hour
+_PWC_CACHE_TTL = 3600
+_PWC_CACHE_DIR = Path(".cache/pwc")
+
+# Parameter-count patterns like "7b", "125m", "800k", compiled once instead of
+# per model
+_PARAM_COUNT_PATTERNS = [
+    (re.compile(r'(\d+\.?\d*)\s*b(?:illion)?'), 1_000_000_000),
+    (re.compile(r'(\d+\.?\d*)\s*m(?:illion)?'), 1_000_000),
+    (re.compile(r'(\d+\.?\d*)\s*k(?:thousand)?'), 1_000),
+]
+
+
+def _parse_hub_datetime(dt_str: str) -> Optional[datetime]:
+    """Parse a Hub timestamp, fast-pathing the fixed 'YYYY-MM-DDTHH:MM:SS.fffZ' shape"""
+    try:
+        if len(dt_str) == 24 and dt_str[10] == 'T' and dt_str[-1] == 'Z':
+            return datetime(
+                int(dt_str[0:4]), int(dt_str[5:7]), int(dt_str[8:10]),
+                int(dt_str[11:13]), int(dt_str[14:16]), int(dt_str[17:19]),
+                int(dt_str[20:23]) * 1000, tzinfo=timezone.utc
+            )
+
+        # Fallback for any other shape
+        if dt_str.endswith('Z'):
+            dt_str = dt_str[:-1] + '+00:00'
+        elif '+' not in dt_str and 'T' in dt_str:
+            dt_str = dt_str + '+00:00'
+        return datetime.fromisoformat(dt_str)
+    except ValueError:
+        return None
+
+
+def _compile_family_regex(family_patterns: Dict[ModelFamily, List[str]]) -> 're.Pattern':
+    """Compile keyword lists into one alternation with a named group per family"""
+    return re.compile('|'.join(
+        f"(?P<{family.name}>{'|'.join(map(re.escape, patterns))})"
+        for family, patterns in family_patterns.items()
+    ))
+
+
+# Families detectable from benchmark model names (paperswithcode results)
+_DETECT_FAMILY_RE = _compile_family_regex({
+    ModelFamily.BERT: ['bert', 'roberta', 'deberta'],
+    ModelFamily.VIT: ['vit', 'vision transformer'],
+    ModelFamily.RESNET: ['resnet'],
+    ModelFamily.GPT: ['gpt'],
+    ModelFamily.T5: ['t5'],
+    ModelFamily.EFFICIENTNET: ['efficientnet'],
+    # Add more patterns as needed
+})
+
+# Families detectable from Hub model IDs and tags
+_EXTRACT_FAMILY_RE = _compile_family_regex({
+    ModelFamily.BERT: ['bert', 'distilbert', 'roberta', 'deberta', 'albert'],
+    ModelFamily.GPT: ['gpt', 'gpt2', 'gpt-neo', 'gpt-j'],
+    ModelFamily.T5: ['t5', 'flan-t5', 'ul2'],
+    ModelFamily.LLAMA: ['llama', 'llama2', 'llama-2'],
+    ModelFamily.MISTRAL: ['mistral'],
+    ModelFamily.GEMMA: ['gemma'],
+    ModelFamily.FALCON: ['falcon'],
+    ModelFamily.BLOOM: ['bloom'],
+    ModelFamily.RESNET: ['resnet'],
+    ModelFamily.VIT: ['vit', 'vision-transformer', 'deit'],
+    ModelFamily.EFFICIENTNET: ['efficientnet'],
+    ModelFamily.MOBILENET: ['mobilenet'],
+    ModelFamily.DENSENET: ['densenet'],
+    ModelFamily.INCEPTION: ['inception'],
+    ModelFamily.CLIP: ['clip'],
+    ModelFamily.BLIP: ['blip'],
+    ModelFamily.WHISPER: ['whisper'],
+    ModelFamily.WAV2VEC: ['wav2vec'],
+    ModelFamily.ELECTRA: ['electra'],
+})
+
+# Size keywords screened with one Aho-Corasick pass; ranks break ties so the
+# larger bucket wins when keywords overlap (e.g. "xxl" also contains "xl")
+_SIZE_KEYWORDS = {
+    ModelSize.TINY: ['tiny', 'mini'],
+    ModelSize.SMALL: ['small', 'lite'],
+    ModelSize.BASE: ['base'],
+    ModelSize.LARGE: ['large'],
+    ModelSize.XL: ['xl', 'x-large'],
+    ModelSize.XXL: ['xxl', 'xx-large', '11b', '13b', '30b', '70b'],
+}
+_SIZE_RANKS = {size: rank for rank, size in enumerate(_SIZE_KEYWORDS)}
+_SIZE_AUTOMATON = ahocorasick.Automaton()
+for _size, _keywords in _SIZE_KEYWORDS.items():
+    for _keyword in _keywords:
+        _SIZE_AUTOMATON.add_word(_keyword, _size)
+_SIZE_AUTOMATON.make_automaton()
+
+_METRIC_NAME_MAP = {
+    "accuracy": MetricType.ACCURACY,
+    "f1": MetricType.F1,
+    "precision": MetricType.PRECISION,
+    "recall": MetricType.RECALL,
+    "bleu": MetricType.BLEU,
+    "rouge": MetricType.ROUGE,
+    "rouge1": MetricType.ROUGE,
+    "rouge2": MetricType.ROUGE,
+    "rougel": MetricType.ROUGE,
+    "perplexity": MetricType.PERPLEXITY,
+    "wer": MetricType.WER,
+    "cer": MetricType.CER,
+    "exact_match": MetricType.EXACT_MATCH,
+    "squad": MetricType.SQUAD,
+    "bertscore": MetricType.BERTSCORE,
+    "meteor": MetricType.METEOR,
+    "mse": MetricType.MSE,
+    "mae": MetricType.MAE,
+    "r2": MetricType.R2,
+    "auc": MetricType.AUC,
+    "map": MetricType.MAP,
+    "iou": MetricType.IOU,
+}
+
+
+# Module-level so the cache is keyed on the name alone; ~20 distinct names
+# recur across thousands of evaluation results
+@lru_cache(maxsize=1024)
+def _map_metric_name(metric_name: str) -> MetricType:
+    """Map metric name string to MetricType enum"""
+    for key, value in _METRIC_NAME_MAP.items():
+        if key in metric_name:
+            return value
+
+    return MetricType.ACCURACY  # Default fallback
+
+
+# Benchmark tables repeat model names heavily (many "BERT-large-*" variants),
+# so a small LRU turns repeat detections into a dict lookup
+@lru_cache(maxsize=4096)
+def _detect_model_family_cached(model_name: str) -> ModelFamily:
+    """Detect model family from a benchmark result model name"""
+    match = _DETECT_FAMILY_RE.search(model_name.lower())
+    return ModelFamily[match.lastgroup] if match else ModelFamily.OTHER
+
+
+@dataclass
+class _FamilyAccum:
+    """Per-family accumulator used while computing summary statistics"""
+    count: int = 0
+    metrics: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    tasks: Dict[TaskType, int] = field(default_factory=lambda: defaultdict(int))
+
+
+@dataclass
+class BenchmarkIndexes:
+    """Groupings shared by the summary/correlation/leaderboard computations.
+
+    Built in one pass over the entries so the three consumers read grouped
+    data instead of each re-traversing every model and evaluation result.
+    The metric series are frozen into float64 arrays at the end of the build,
+    so consumers reduce columnar data rather than Python lists.
+    """
+    entries_by_task: Dict[TaskType, List[BenchmarkEntry]] = field(default_factory=lambda: defaultdict(list))
+    entries_by_family: Dict[ModelFamily, List[BenchmarkEntry]] = field(default_factory=lambda: defaultdict(list))
+    datasets: Set[str] = field(default_factory=set)
+    task_model_count: Dict[TaskType, int] = field(default_factory=lambda: defaultdict(int))
+    dataset_task_map: Dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
+    dataset_metrics: Dict[str, Dict[str, List[float]]] = field(default_factory=dict)
+    dataset_models: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))
+    family_stats: Dict[ModelFamily, _FamilyAccum] = field(default_factory=lambda: defaultdict(_FamilyAccum))
+    # Per-task metric series from entries reporting at least two metrics,
+    # consumed by the correlation matrices
+    task_metrics: Dict[TaskType, Dict[str, List[float]]] = field(default_factory=dict)
+    # (entry, eval_result) pairs per task and dataset, consumed by the
+    # leaderboards
+    task_dataset_results: Dict[TaskType, Dict[str, list]] = field(default_factory=dict)
+
+
+class _AsyncByteReader:
+    """Minimal async file-like adapter over an httpx streamed response for ijson"""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            # ijson probes with read(0) to detect byte vs text streams
+            return b''
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b''
+
 
 class HuggingFaceDataFetcher:
     def __init__(self):
         self.base_url = "https://huggingface.co/api"
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # Single long-lived client shared by all fetches: the connection pool
+        # keeps sockets alive between requests, so we pay TLS/TCP setup once
+        # per host instead of once per call. The transport retries transient
+        # connection failures with backoff instead of surfacing an empty
+        # result for the whole refresh.
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                retries=3,
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            )
+        )
         self.datasets_base_url = "https://datasets-server.huggingface.co"
         self.paperswithcode_url = "https://paperswithcode.com/api/v1"
+        # Cap concurrent Hub requests so fan-out doesn't exhaust the pool
+        self.fetch_semaphore = asyncio.Semaphore(8)
+        # In-process layer of the paperswithcode cache: url -> (expiry, data)
+        self._pwc_cache: Dict[str, Any] = {}
+        # Generator API draws batches without the legacy global-state lock
+        self.rng = np.random.default_rng()
 
     async def __aenter__(self):
         return self
@@ -38,15 +248,14 @@ class HuggingFaceDataFetcher:
     async def fetch_real_benchmark_data(self) -> List[BenchmarkEntry]:
         """Fetch real benchmark data from multiple sources"""
         try:
-            # Fetch from multiple sources concurrently
-            async with aiohttp.ClientSession() as session:
-                tasks = [
-                    self._fetch_glue_benchmarks(session),
-                    self._fetch_imagenet_benchmarks(session),
-                    self._fetch_squad_benchmarks(session),
-                    self._fetch_wmt_benchmarks(session),
-                ]
-                results = await asyncio.gather(*tasks)
+            # Fetch from multiple sources concurrently on the shared client
+            tasks = [
+                self._fetch_glue_benchmarks(),
+                self._fetch_imagenet_benchmarks(),
+                self._fetch_squad_benchmarks(),
+                self._fetch_wmt_benchmarks(),
+            ]
+            results = await asyncio.gather(*tasks)
 
             # Combine and process results
             benchmark_entries = []
@@ -59,182 +268,148 @@ class HuggingFaceDataFetcher:
             logger.error(f"Error fetching real benchmark data: {e}")
             return []
 
-    async def _fetch_glue_benchmarks(self, session: aiohttp.ClientSession) -> List[BenchmarkEntry]:
-        """Fetch GLUE benchmark results"""
-        async with session.get(f"{self.paperswithcode_url}/sota/glue") as response:
-            if response.status != 200:
-                return []
-
-            data = await response.json()
-            entries = []
+    async def _get_pwc_json(self, url: str) -> Optional[Any]:
+        """Fetch a paperswithcode payload through a memory -> disk -> network cache
 
-            for result in data.get("results", []):
-                model_name = result.get("model_name")
-                if not model_name:
-                    continue
+        Only successful (200) responses are cached; misses fall through to the
+        network and repopulate both layers.
+        """
+        cached = self._pwc_cache.get(url)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
 
-                eval_results = []
-                for metric in result.get("metrics", []):
-                    eval_results.append(EvaluationResult(
-                        metric_name=metric.get("name", "accuracy"),
-                        metric_type=MetricType.ACCURACY,
-                        value=float(metric.get("value", 0)),
-                        dataset_name="GLUE",
-                        dataset_config=metric.get("dataset_name"),
-                        dataset_split="test"
-                    ))
+        cache_file = _PWC_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+        try:
+            if cache_file.exists() and time.time() - cache_file.stat().st_mtime < _PWC_CACHE_TTL:
+                data = orjson.loads(cache_file.read_bytes())
+                self._pwc_cache[url] = (time.monotonic() + _PWC_CACHE_TTL, data)
+                return data
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable paperswithcode cache file: {e}")
+
+        response = await self.client.get(url)
+        if response.status_code != 200:
+            return None
 
-                if eval_results:
-                    entries.append(BenchmarkEntry(
-                        model_info=ModelInfo(
-                            model_id=model_name,
-                            model_name=model_name,
-                            model_family=self._detect_model_family(model_name),
-                            task_type=TaskType.TEXT_CLASSIFICATION,
-                            created_at=datetime.now(timezone.utc),
-                            tags=["glue", "text-classification"]
-                        ),
-                        evaluation_results=eval_results,
-                        evaluated_at=datetime.now(timezone.utc)
-                    ))
+        data = orjson.loads(response.content)
+        self._pwc_cache[url] = (time.monotonic() + _PWC_CACHE_TTL, data)
+        try:
+            # Write-then-rename so a crashed refresh never leaves a torn file
+            _PWC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            tmp_file.write_bytes(response.content)
+            tmp_file.replace(cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write paperswithcode cache file: {e}")
 
-            return entries
+        return data
 
-    async def _fetch_imagenet_benchmarks(self, session: aiohttp.ClientSession) -> List[BenchmarkEntry]:
-        """Fetch ImageNet benchmark results"""
-        async with session.get(f"{self.paperswithcode_url}/sota/image-classification-on-imagenet") as response:
-            if response.status != 200:
-                return []
+    async def _fetch_glue_benchmarks(self) -> List[BenchmarkEntry]:
+        """Fetch GLUE benchmark results"""
+        data = await self._get_pwc_json(f"{self.paperswithcode_url}/sota/glue")
+        if data is None:
+            return []
 
-            data = await response.json()
-            entries = []
+        entries = []
+        now = datetime.now(timezone.utc)
 
-            for result in data.get("results", []):
-                model_name = result.get("model_name")
-                if not model_name:
-                    continue
+        for result in data.get("results", []):
+            model_name = result.get("model_name")
+            if not model_name:
+                continue
 
-                accuracy = result.get("metrics", {}).get("accuracy")
-                if accuracy is None:
-                    continue
+            eval_results = []
+            for metric in result.get("metrics", []):
+                eval_results.append(EvaluationResult.model_construct(
+                    metric_name=metric.get("name", "accuracy"),
+                    metric_type=MetricType.ACCURACY,
+                    value=float(metric.get("value", 0)),
+                    dataset_name="GLUE",
+                    dataset_config=metric.get("dataset_name"),
+                    dataset_split="test"
+                ))
 
-                entries.append(BenchmarkEntry(
-                    model_info=ModelInfo(
+            if eval_results:
+                entries.append(BenchmarkEntry.model_construct(
+                    model_info=ModelInfo.model_construct(
                         model_id=model_name,
                         model_name=model_name,
                         model_family=self._detect_model_family(model_name),
-                        task_type=TaskType.IMAGE_CLASSIFICATION,
-                        created_at=datetime.now(timezone.utc),
-                        tags=["imagenet", "image-classification"]
+                        task_type=TaskType.TEXT_CLASSIFICATION,
+                        created_at=now,
+                        tags=["glue", "text-classification"]
                     ),
-                    evaluation_results=[
-                        EvaluationResult(
-                            metric_name="accuracy",
-                            metric_type=MetricType.ACCURACY,
-                            value=float(accuracy),
-                            dataset_name="ImageNet",
-                            dataset_split="validation"
-                        )
-                    ],
-                    evaluated_at=datetime.now(timezone.utc)
+                    evaluation_results=eval_results,
+                    evaluated_at=now
                 ))
 
-            return entries
+        return entries
 
-    def _detect_model_family(self, model_name: str) -> ModelFamily:
-        """Detect model family from model name"""
-        name_lower = model_name.lower()
-
-        # Map of keywords to model families
-        family_patterns = {
-            ModelFamily.BERT: ['bert', 'roberta', 'deberta'],
-            ModelFamily.VIT: ['vit', 'vision transformer'],
-            ModelFamily.RESNET: ['resnet'],
-            ModelFamily.GPT: ['gpt'],
-            ModelFamily.T5: ['t5'],
-            ModelFamily.EFFICIENTNET: ['efficientnet'],
-            # Add more patterns as needed
-        }
+    async def _fetch_imagenet_benchmarks(self) -> List[BenchmarkEntry]:
+        """Fetch ImageNet benchmark results"""
+        data = await self._get_pwc_json(f"{self.paperswithcode_url}/sota/image-classification-on-imagenet")
+        if data is None:
+            return []
 
-        for family, patterns in family_patterns.items():
-            if any(pattern in name_lower for pattern in patterns):
-                return family
-
-        return ModelFamily.OTHER
-
-    def _extract_model_family(self, model_id: str, tags: List[str]) -> ModelFamily:
-        """Extract model family from model ID and tags"""
-        model_id_lower = model_id.lower()
-        tags_lower = [tag.lower() for tag in tags]
-
-        family_patterns = {
-            ModelFamily.BERT: ['bert', 'distilbert', 'roberta', 'deberta', 'albert'],
-            ModelFamily.GPT: ['gpt', 'gpt2', 'gpt-neo', 'gpt-j'],
-            ModelFamily.T5: ['t5', 'flan-t5', 'ul2'],
-            ModelFamily.LLAMA: ['llama', 'llama2', 'llama-2'],
-            ModelFamily.MISTRAL: ['mistral'],
-            ModelFamily.GEMMA: ['gemma'],
-            ModelFamily.FALCON: ['falcon'],
-            ModelFamily.BLOOM: ['bloom'],
-            ModelFamily.RESNET: ['resnet'],
-            ModelFamily.VIT: ['vit', 'vision-transformer', 'deit'],
-            ModelFamily.EFFICIENTNET: ['efficientnet'],
-            ModelFamily.MOBILENET: ['mobilenet'],
-            ModelFamily.DENSENET: ['densenet'],
-            ModelFamily.INCEPTION: ['inception'],
-            ModelFamily.CLIP: ['clip'],
-            ModelFamily.BLIP: ['blip'],
-            ModelFamily.WHISPER: ['whisper'],
-            ModelFamily.WAV2VEC: ['wav2vec'],
-            ModelFamily.ELECTRA: ['electra'],
-        }
+        entries = []
+        now = datetime.now(timezone.utc)
 
-        for family, patterns in family_patterns.items():
-            if any(pattern in model_id_lower or pattern in ' '.join(tags_lower) for pattern in patterns):
-                return family
-
-        return ModelFamily.OTHER
-
-    def _extract_model_size(self, model_id: str, tags: List[str]) -> Optional[ModelSize]:
-        """Extract model size from model ID and tags"""
-        text = f"{model_id} {' '.join(tags)}".lower()
-
-        if any(size in text for size in ['tiny', 'mini']):
-            return ModelSize.TINY
-        elif any(size in text for size in ['small', 'lite']):
-            return ModelSize.SMALL
-        elif any(size in text for size in ['base']):
-            return ModelSize.BASE
-        elif any(size in text for size in ['large']):
-            return ModelSize.LARGE
-        elif any(size in text for size in ['xl', 'x-large']):
-            return ModelSize.XL
-        elif any(size in text for size in ['xxl', 'xx-large', '11b', '13b', '30b', '70b']):
-            return ModelSize.XXL
+        for result in data.get("results", []):
+            model_name = result.get("model_name")
+            if not model_name:
+                continue
 
-        return None
+            accuracy = result.get("metrics", {}).get("accuracy")
+            if accuracy is None:
+                continue
 
-    def _extract_parameter_count(self, model_id: str, tags: List[str]) -> Optional[int]:
-        """Extract parameter count from model ID, tags, or card data"""
-        text = f"{model_id} {' '.join(tags)}".lower()
+            entries.append(BenchmarkEntry.model_construct(
+                model_info=ModelInfo.model_construct(
+                    model_id=model_name,
+                    model_name=model_name,
+                    model_family=self._detect_model_family(model_name),
+                    task_type=TaskType.IMAGE_CLASSIFICATION,
+                    created_at=now,
+                    tags=["imagenet", "image-classification"]
+                ),
+                evaluation_results=[
+                    EvaluationResult.model_construct(
+                        metric_name="accuracy",
+                        metric_type=MetricType.ACCURACY,
+                        value=float(accuracy),
+                        dataset_name="ImageNet",
+                        dataset_split="validation"
+                    )
+                ],
+                evaluated_at=now
+            ))
 
-        # Look for patterns like "7b", "13b", "70b", etc.
-        patterns = [
-            r'(\d+\.?\d*)\s*b(?:illion)?',
-            r'(\d+\.?\d*)\s*m(?:illion)?',
-            r'(\d+\.?\d*)\s*k(?:thousand)?'
-        ]
+        return entries
 
-        for pattern in patterns:
-            match = re.search(pattern, text)
+    def _detect_model_family(self, model_name: str) -> ModelFamily:
+        """Detect model family from model name"""
+        return _detect_model_family_cached(model_name)
+
+    def _extract_model_family(self, text: str) -> ModelFamily:
+        """Extract model family from pre-lowercased model ID and tags text"""
+        match = _EXTRACT_FAMILY_RE.search(text)
+        return ModelFamily[match.lastgroup] if match else ModelFamily.OTHER
+
+    def _extract_model_size(self, text: str) -> Optional[ModelSize]:
+        """Extract model size from pre-lowercased model ID and tags text"""
+        best_size = None
+        for _, size in _SIZE_AUTOMATON.iter(text):
+            if best_size is None or _SIZE_RANKS[size] > _SIZE_RANKS[best_size]:
+                best_size = size
+
+        return best_size
+
+    def _extract_parameter_count(self, text: str) -> Optional[int]:
+        """Extract parameter count from pre-lowercased model ID and tags text"""
+        for pattern, multiplier in _PARAM_COUNT_PATTERNS:
+            match = pattern.search(text)
             if match:
-                num = float(match.group(1))
-                if 'b' in pattern:
-                    return int(num * 1_000_000_000)
-                elif 'm' in pattern:
-                    return int(num * 1_000_000)
-                elif 'k' in pattern:
-                    return int(num * 1_000)
+                return int(float(match.group(1)) * multiplier)
 
         return None
 
@@ -293,39 +468,15 @@ class HuggingFaceDataFetcher:
 
     def _map_metric_name(self, metric_name: str) -> MetricType:
         """Map metric name string to MetricType enum"""
-        mapping = {
-            "accuracy": MetricType.ACCURACY,
-            "f1": MetricType.F1,
-            "precision": MetricType.PRECISION,
-            "recall": MetricType.RECALL,
-            "bleu": MetricType.BLEU,
-            "rouge": MetricType.ROUGE,
-            "rouge1": MetricType.ROUGE,
-            "rouge2": MetricType.ROUGE,
-            "rougel": MetricType.ROUGE,
-            "perplexity": MetricType.PERPLEXITY,
-            "wer": MetricType.WER,
-            "cer": MetricType.CER,
-            "exact_match": MetricType.EXACT_MATCH,
-            "squad": MetricType.SQUAD,
-            "bertscore": MetricType.BERTSCORE,
-            "meteor": MetricType.METEOR,
-            "mse": MetricType.MSE,
-            "mae": MetricType.MAE,
-            "r2": MetricType.R2,
-            "auc": MetricType.AUC,
-            "map": MetricType.MAP,
-            "iou": MetricType.IOU,
-        }
-
-        for key, value in mapping.items():
-            if key in metric_name:
-                return value
-
-        return MetricType.ACCURACY  # Default fallback
+        return _map_metric_name(metric_name)
 
     async def fetch_models_by_task(self, task: str, limit: int = 100) -> List[Dict]:
-        """Fetch models for a specific task from Hugging Face Hub"""
+        """Fetch models for a specific task from Hugging Face Hub
+
+        The response is decoded incrementally while it streams in, so the
+        multi-megabyte model list is never buffered as raw bytes before
+        parsing.
+        """
         url = f"{self.base_url}/models"
         params = {
             "pipeline_tag": task,
@@ -336,9 +487,11 @@ class HuggingFaceDataFetcher:
         }
 
         try:
-            response = await self.client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+            async with self.fetch_semaphore:
+                async with self.client.stream("GET", url, params=params) as response:
+                    response.raise_for_status()
+                    return [model async for model
+                            in ijson.items_async(_AsyncByteReader(response), 'item')]
         except Exception as e:
             logger.error(f"Error fetching models for task {task}: {e}")
             return []
@@ -350,11 +503,21 @@ class HuggingFaceDataFetcher:
         try:
             response = await self.client.get(url)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.warning(f"Error fetching details for model {model_id}: {e}")
             return None
 
+    async def fetch_model_details_batch(self, model_ids: List[str]) -> List[Optional[Dict]]:
+        """Fetch details for many models concurrently on the shared connection pool"""
+        semaphore = asyncio.Semaphore(64)
+
+        async def _fetch_one(model_id: str) -> Optional[Dict]:
+            async with semaphore:
+                return await self.fetch_model_details(model_id)
+
+        return await asyncio.gather(*(_fetch_one(model_id) for model_id in model_ids))
+
     def _generate_synthetic_eval_results(self, task_type: TaskType, model_family: ModelFamily) -> List[EvaluationResult]:
         """Generate synthetic evaluation results based on task type and model family"""
         results = []
@@ -390,29 +553,38 @@ class HuggingFaceDataFetcher:
             # Default ranges
             perf_range = {"accuracy": (0.70, 0.85), "f1": (0.68, 0.83)}
 
-        # Generate results for 1-2 datasets
-        for dataset in datasets[:2]:
-            for metric_name, (min_val, max_val) in perf_range.items():
-                try:
-                    metric_type = self._map_metric_name(metric_name)
-                    value = np.random.uniform(min_val, max_val)
-
-                    results.append(EvaluationResult(
-                        metric_name=metric_name,
-                        metric_type=metric_type,
-                        value=round(value, 4),
-                        dataset_name=dataset,
-                        dataset_split="test"
-                    ))
-                except Exception as e:
-                    logger.warning(f"Error generating synthetic result: {e}")
-                    continue
+        # Generate results for 1-2 datasets, drawing all uniforms for the
+        # dataset x metric grid in one vectorized call
+        cells = [(dataset, metric_name, min_val, max_val)
+                 for dataset in datasets[:2]
+                 for metric_name, (min_val, max_val) in perf_range.items()]
+        lows = np.fromiter((cell[2] for cell in cells), dtype=np.float64)
+        highs = np.fromiter((cell[3] for cell in cells), dtype=np.float64)
+        values = np.round(self.rng.uniform(lows, highs), 4)
+
+        for (dataset, metric_name, _, _), value in zip(cells, values):
+            try:
+                metric_type = self._map_metric_name(metric_name)
+
+                results.append(EvaluationResult(
+                    metric_name=metric_name,
+                    metric_type=metric_type,
+                    value=float(value),
+                    dataset_name=dataset,
+                    dataset_split="test"
+                ))
+            except Exception as e:
+                logger.warning(f"Error generating synthetic result: {e}")
+                continue
 
         return results
 
     async def fetch_benchmark_data(self, max_models_per_task: int = 50) -> List[BenchmarkEntry]:
         """Fetch comprehensive benchmark data from Hugging Face Hub"""
-        benchmark_entries = []
+        # Keyed by model_id so duplicates are dropped on insertion; the first
+        # entry seen for a model wins
+        benchmark_entries: Dict[str, BenchmarkEntry] = {}
+        now = datetime.now(timezone.utc)
 
         # Define tasks to fetch
         tasks = [
@@ -427,133 +599,174 @@ class HuggingFaceDataFetcher:
             "automatic-speech-recognition"
         ]
 
-        for task in tasks:
-            logger.info(f"Fetching models for task: {task}")
-            models = await self.fetch_models_by_task(task, max_models_per_task)
-
-            for model_data in models:
-                try:
-                    model_id = model_data.get("id", "")
-                    if not model_id:
-                        continue
-
-                    # Extract model information
-                    tags = model_data.get("tags", [])
-                    pipeline_tag = model_data.get("pipeline_tag", task)
-
-                    task_type = self._map_pipeline_to_task(pipeline_tag)
-                    model_family = self._extract_model_family(model_id, tags)
-                    model_size = self._extract_model_size(model_id, tags)
-                    parameter_count = self._extract_parameter_count(model_id, tags)
-
-                    # Parse dates - ensure timezone-aware datetimes
-                    created_at = None
-                    last_modified = None
-                    if model_data.get("createdAt"):
-                        try:
-                            dt_str = model_data["createdAt"]
-                            if dt_str.endswith('Z'):
-                                dt_str = dt_str.replace('Z', '+00:00')
-                            elif '+' not in dt_str and 'T' in dt_str:
-                                dt_str = dt_str + '+00:00'
-                            created_at = datetime.fromisoformat(dt_str)
-                        except:
-                            # Fallback to current time if parsing fails
-                            created_at = datetime.now(timezone.utc)
-                    if model_data.get("lastModified"):
-                        try:
-                            dt_str = model_data["lastModified"]
-                            if dt_str.endswith('Z'):
-                                dt_str = dt_str.replace('Z', '+00:00')
-                            elif '+' not in dt_str and 'T' in dt_str:
-                                dt_str = dt_str + '+00:00'
-                            last_modified = datetime.fromisoformat(dt_str)
-                        except:
-                            # Fallback to current time if parsing fails
-                            last_modified = datetime.now(timezone.utc)
-
-                    model_info = ModelInfo(
-                        model_id=model_id,
-                        model_name=model_data.get("modelId", model_id),
-                        model_family=model_family,
-                        model_size=model_size,
-                        parameter_count=parameter_count,
-                        task_type=task_type,
-                        created_at=created_at,
-                        last_modified=last_modified,
-                        downloads=model_data.get("downloads", 0),
-                        likes=model_data.get("likes", 0),
-                        library_name=model_data.get("library_name"),
-                        license=model_data.get("license"),
-                        tags=tags,
-                        pipeline_tag=pipeline_tag
-                    )
+        # Fetch all task model lists concurrently instead of one at a time
+        logger.info(f"Fetching models for {len(tasks)} tasks concurrently")
+        model_lists = await asyncio.gather(
+            *[self.fetch_models_by_task(task, max_models_per_task) for task in tasks],
+            return_exceptions=True
+        )
 
-                    # Parse evaluation results or generate synthetic ones
-                    eval_results = []
-                    card_data = model_data.get("cardData", {})
-                    if card_data and "eval_results" in card_data:
-                        eval_results = self._parse_eval_results(card_data["eval_results"])
-
-                    # If no evaluation results found, generate synthetic ones
-                    if not eval_results:
-                        eval_results = self._generate_synthetic_eval_results(task_type, model_family)
-
-                    if eval_results:  # Only add if we have some evaluation data
-                        # Ensure timezone-aware datetime for evaluated_at
-                        evaluated_at = last_modified
-                        if evaluated_at is None:
-                            evaluated_at = datetime.now(timezone.utc)
-
-                        benchmark_entry = BenchmarkEntry(
-                            model_info=model_info,
-                            evaluation_results=eval_results,
-                            evaluated_at=evaluated_at
-                        )
-                        benchmark_entries.append(benchmark_entry)
+        for task, models in zip(tasks, model_lists):
+            if isinstance(models, Exception):
+                logger.error(f"Error fetching models for task {task}: {models}")
+                continue
 
-                except Exception as e:
-                    logger.warning(f"Error processing model {model_data.get('id', 'unknown')}: {e}")
-                    continue
+            # Per-model parsing is pure CPU work; run it in a worker thread so
+            # it doesn't stall the event loop between awaits
+            task_entries = await asyncio.to_thread(self._process_task_models, task, models, now)
+            for entry in task_entries:
+                benchmark_entries.setdefault(entry.model_info.model_id, entry)
 
         # Fetch real benchmark data and combine with model data
         real_benchmarks = await self.fetch_real_benchmark_data()
-        benchmark_entries.extend(real_benchmarks)
+        for entry in real_benchmarks:
+            benchmark_entries.setdefault(entry.model_info.model_id, entry)
 
-        # Remove duplicates by model_id
-        seen_models = set()
-        unique_entries = []
-        for entry in benchmark_entries:
-            if entry.model_info.model_id not in seen_models:
-                seen_models.add(entry.model_info.model_id)
-                unique_entries.append(entry)
+        logger.info(f"Successfully fetched {len(benchmark_entries)} benchmark entries ({len(real_benchmarks)} real benchmarks)")
+        return list(benchmark_entries.values())
 
-        logger.info(f"Successfully fetched {len(unique_entries)} benchmark entries ({len(real_benchmarks)} real benchmarks)")
-        return unique_entries
+    def _process_task_models(self, task: str, models: List[Dict], now: datetime) -> List[BenchmarkEntry]:
+        """Build benchmark entries from one task's raw model records"""
+        entries = []
 
-    def compute_summary_statistics(self, benchmark_entries: List[BenchmarkEntry]) -> BenchmarkSummary:
-        """Compute summary statistics from benchmark data"""
+        for model_data in models:
+            try:
+                model_id = model_data.get("id", "")
+                if not model_id:
+                    continue
 
-        # Basic counts
-        total_models = len(benchmark_entries)
-        datasets = set()
-        task_model_count = defaultdict(int)
-        dataset_task_map = defaultdict(set)
-        family_stats = defaultdict(lambda: {'count': 0, 'metrics': defaultdict(list), 'tasks': defaultdict(int)})
+                # Extract model information
+                tags = model_data.get("tags", [])
+                pipeline_tag = model_data.get("pipeline_tag", task)
+
+                task_type = self._map_pipeline_to_task(pipeline_tag)
+
+                # Lowercase the id+tags text once and share it across the
+                # family/size/parameter extractors
+                text_lower = f"{model_id} {' '.join(tags)}".lower()
+                model_family = self._extract_model_family(text_lower)
+                model_size = self._extract_model_size(text_lower)
+                parameter_count = self._extract_parameter_count(text_lower)
+
+                # Parse dates - ensure timezone-aware datetimes, falling
+                # back to current time if parsing fails
+                created_at = None
+                last_modified = None
+                if model_data.get("createdAt"):
+                    created_at = _parse_hub_datetime(model_data["createdAt"]) or now
+                if model_data.get("lastModified"):
+                    last_modified = _parse_hub_datetime(model_data["lastModified"]) or now
+
+                model_info = ModelInfo(
+                    model_id=model_id,
+                    model_name=model_data.get("modelId", model_id),
+                    model_family=model_family,
+                    model_size=model_size,
+                    parameter_count=parameter_count,
+                    task_type=task_type,
+                    created_at=created_at,
+                    last_modified=last_modified,
+                    downloads=model_data.get("downloads", 0),
+                    likes=model_data.get("likes", 0),
+                    library_name=model_data.get("library_name"),
+                    license=model_data.get("license"),
+                    tags=tags,
+                    pipeline_tag=pipeline_tag
+                )
+
+                # Parse evaluation results or generate synthetic ones
+                eval_results = []
+                card_data = model_data.get("cardData", {})
+                if card_data and "eval_results" in card_data:
+                    eval_results = self._parse_eval_results(card_data["eval_results"])
+
+                # If no evaluation results found, generate synthetic ones
+                if not eval_results:
+                    eval_results = self._generate_synthetic_eval_results(task_type, model_family)
+
+                if eval_results:  # Only add if we have some evaluation data
+                    # Ensure timezone-aware datetime for evaluated_at
+                    evaluated_at = last_modified
+                    if evaluated_at is None:
+                        evaluated_at = now
+
+                    entries.append(BenchmarkEntry(
+                        model_info=model_info,
+                        evaluation_results=eval_results,
+                        evaluated_at=evaluated_at
+                    ))
+
+            except Exception as e:
+                logger.warning(f"Error processing model {model_data.get('id', 'unknown')}: {e}")
+                continue
+
+        return entries
+
+    def build_indexes(self, benchmark_entries: List[BenchmarkEntry]) -> BenchmarkIndexes:
+        """Build every grouping the compute methods need in one entries pass"""
+        indexes = BenchmarkIndexes()
 
-        # Collect data for analysis
         for entry in benchmark_entries:
             model = entry.model_info
-            task_model_count[model.task_type] += 1
+            task_type = model.task_type
+            indexes.task_model_count[task_type] += 1
+            indexes.entries_by_task[task_type].append(entry)
+            indexes.entries_by_family[model.model_family].append(entry)
 
+            family_accum = indexes.family_stats[model.model_family]
+            model_metrics = {}
             for eval_result in entry.evaluation_results:
-                datasets.add(eval_result.dataset_name)
-                dataset_task_map[eval_result.dataset_name].add(model.task_type)
+                dataset_name = eval_result.dataset_name
+                indexes.datasets.add(dataset_name)
+                indexes.dataset_task_map[dataset_name][task_type] += 1
+                indexes.dataset_metrics.setdefault(dataset_name, {}) \
+                    .setdefault(eval_result.metric_name, []).append(eval_result.value)
+                indexes.dataset_models[dataset_name].add(model.model_id)
+                indexes.task_dataset_results.setdefault(task_type, {}) \
+                    .setdefault(dataset_name, []).append((entry, eval_result))
 
                 # Family statistics
-                family_stats[model.model_family]['count'] += 1
-                family_stats[model.model_family]['metrics'][eval_result.metric_name].append(eval_result.value)
-                family_stats[model.model_family]['tasks'][model.task_type] += 1
+                family_accum.count += 1
+                family_accum.metrics[eval_result.metric_name].append(eval_result.value)
+                family_accum.tasks[task_type] += 1
+
+                model_metrics[eval_result.metric_name] = eval_result.value
+
+            # Correlations only consider models reporting multiple metrics
+            if len(model_metrics) >= 2:
+                task_metric_values = indexes.task_metrics.setdefault(task_type, {})
+                for metric_name, value in model_metrics.items():
+                    task_metric_values.setdefault(metric_name, []).append(value)
+
+        # Freeze the accumulated metric series into float64 arrays so the
+        # downstream reductions run columnar instead of over Python lists
+        for metrics in indexes.dataset_metrics.values():
+            for metric_name, values in metrics.items():
+                metrics[metric_name] = np.asarray(values, dtype=np.float64)
+        for accum in indexes.family_stats.values():
+            for metric_name, values in accum.metrics.items():
+                accum.metrics[metric_name] = np.asarray(values, dtype=np.float64)
+        for metrics in indexes.task_metrics.values():
+            for metric_name, values in metrics.items():
+                metrics[metric_name] = np.asarray(values, dtype=np.float64)
+
+        return indexes
+
+    def compute_summary_statistics(self, benchmark_entries: List[BenchmarkEntry],
+                                   indexes: Optional[BenchmarkIndexes] = None) -> BenchmarkSummary:
+        """Compute summary statistics from benchmark data"""
+        if indexes is None:
+            indexes = self.build_indexes(benchmark_entries)
+
+        total_models = len(benchmark_entries)
+        datasets = indexes.datasets
+        task_model_count = indexes.task_model_count
+        dataset_task_map = indexes.dataset_task_map
+        family_stats = indexes.family_stats
+        entries_by_task = indexes.entries_by_task
+        entries_by_family = indexes.entries_by_family
+        dataset_metrics = indexes.dataset_metrics
+        dataset_models = indexes.dataset_models
 
         total_datasets = len(datasets)
 
@@ -564,23 +777,31 @@ class HuggingFaceDataFetcher:
 
             # Calculate average metrics for this task
             metrics = defaultdict(list)
-            top_models = []
-
-            for entry in benchmark_entries:
-                if entry.model_info.task_type == task_type:
-                    for eval_result in entry.evaluation_results:
-                        metrics[eval_result.metric_name].append(eval_result.value)
-
-                    # Add to top models consideration
-                    if entry.evaluation_results:
-                        avg_score = sum(r.value for r in entry.evaluation_results) / len(entry.evaluation_results)
-                        top_models.append((entry.model_info.model_id, avg_score))
+            scored_model_ids = []
+            scores = []
 
-            # Get top 5 models
-            top_models.sort(key=lambda x: x[1], reverse=True)
-            top_model_ids = [model_id for model_id, _ in top_models[:5]]
-
-            avg_metrics = {name: sum(values) / len(values) for name, values in metrics.items()}
+            for entry in entries_by_task[task_type]:
+                for eval_result in entry.evaluation_results:
+                    metrics[eval_result.metric_name].append(eval_result.value)
+
+                # Add to top models consideration
+                if entry.evaluation_results:
+                    avg_score = sum(r.value for r in entry.evaluation_results) / len(entry.evaluation_results)
+                    scored_model_ids.append(entry.model_info.model_id)
+                    scores.append(avg_score)
+
+            # Get top 5 models: argpartition selects the winners in O(N),
+            # then only those five get sorted
+            top_model_ids = []
+            if scores:
+                score_arr = np.fromiter(scores, dtype=np.float64)
+                k = min(5, len(scores))
+                top_idx = np.argpartition(score_arr, -k)[-k:]
+                top_idx = top_idx[np.argsort(score_arr[top_idx])[::-1]]
+                top_model_ids = [scored_model_ids[i] for i in top_idx]
+
+            avg_metrics = {name: float(np.fromiter(values, dtype=np.float64).mean())
+                           for name, values in metrics.items()}
 
             task_stats.append(TaskStats(
                 task_type=task_type,
@@ -590,35 +811,25 @@ class HuggingFaceDataFetcher:
                 top_models=top_model_ids
             ))
 
-        # Dataset statistics
+        # Dataset statistics, read straight from the fused grouping pass
         dataset_stats = []
         for dataset_name in datasets:
-            dataset_entries = []
-            task_types = set()
-
-            for entry in benchmark_entries:
-                for eval_result in entry.evaluation_results:
-                    if eval_result.dataset_name == dataset_name:
-                        dataset_entries.append(eval_result)
-                        task_types.add(entry.model_info.task_type)
-
-            if dataset_entries:
-                metrics = defaultdict(list)
-                for result in dataset_entries:
-                    metrics[result.metric_name].append(result.value)
+            metrics = dataset_metrics[dataset_name]
+            task_counts = dataset_task_map[dataset_name]
 
-                avg_performance = {name: sum(values) / len(values) for name, values in metrics.items()}
-                best_performance = {name: max(values) for name, values in metrics.items()}
-                worst_performance = {name: min(values) for name, values in metrics.items()}
+            if metrics:
+                # The index builder already froze these into float64 arrays
+                avg_performance = {name: float(arr.mean()) for name, arr in metrics.items()}
+                best_performance = {name: float(arr.max()) for name, arr in metrics.items()}
+                worst_performance = {name: float(arr.min()) for name, arr in metrics.items()}
 
                 # Use the most common task type for this dataset
-                main_task_type = list(task_types)[0] if task_types else TaskType.TEXT_CLASSIFICATION
+                main_task_type = task_counts.most_common(1)[0][0] if task_counts else TaskType.TEXT_CLASSIFICATION
 
                 dataset_stats.append(DatasetStats(
                     dataset_name=dataset_name,
                     task_type=main_task_type,
-                    model_count=len(set(entry.model_info.model_id for entry in benchmark_entries
-                                      if any(r.dataset_name == dataset_name for r in entry.evaluation_results))),
+                    model_count=len(dataset_models[dataset_name]),
                     avg_performance=avg_performance,
                     best_performance=best_performance,
                     worst_performance=worst_performance
@@ -628,66 +839,70 @@ class HuggingFaceDataFetcher:
         model_family_stats = []
         for family, stats in family_stats.items():
             avg_performance = {}
-            for metric_name, values in stats['metrics'].items():
-                if values:
-                    avg_performance[metric_name] = sum(values) / len(values)
+            for metric_name, values in stats.metrics.items():
+                if values.size:
+                    avg_performance[metric_name] = float(values.mean())
 
             # Calculate average parameter count
-            param_counts = []
-            for entry in benchmark_entries:
-                if entry.model_info.model_family == family and entry.model_info.parameter_count:
-                    param_counts.append(entry.model_info.parameter_count)
+            param_counts = [entry.model_info.parameter_count
+                            for entry in entries_by_family[family]
+                            if entry.model_info.parameter_count]
 
-            avg_param_count = sum(param_counts) / len(param_counts) if param_counts else None
+            avg_param_count = float(np.fromiter(param_counts, dtype=np.float64).mean()) if param_counts else None
 
             model_family_stats.append(ModelFamilyStats(
                 family=family,
-                model_count=stats['count'],
+                model_count=stats.count,
                 avg_parameter_count=avg_param_count,
                 avg_performance=avg_performance,
-                task_distribution=dict(stats['tasks'])
+                task_distribution=dict(stats.tasks)
             ))
 
         # Generate trend data (synthetic for now)
         trend_data = []
         end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=365)
+        month_seconds = 30 * 86400
+
+        for task_type, task_entries in entries_by_task.items():
+            # Bucket each entry once by the first monthly point it is visible
+            # at, instead of re-comparing every entry against all 12 dates
+            month_buckets = [[] for _ in range(12)]
+            for entry in task_entries:
+                created_at = entry.model_info.created_at
+                if not created_at:
+                    continue
+                # Ensure timezone-aware datetimes for the bucket computation
+                if created_at.tzinfo is None:
+                    created_at = created_at.replace(tzinfo=timezone.utc)
+
+                delta = (created_at - start_date).total_seconds()
+                month_idx = 0 if delta <= 0 else math.ceil(delta / month_seconds)
+                if month_idx < 12:
+                    month_buckets[month_idx].append(entry)
 
-        for task_type in task_model_count.keys():
-            # Generate monthly trend points
-            for month in range(12):
-                trend_date = start_date + timedelta(days=30 * month)
-
-                # Get models from this time period - handle timezone-aware comparison
-                period_entries = []
-                for entry in benchmark_entries:
-                    if entry.model_info.task_type == task_type and entry.model_info.created_at:
-                        created_at = entry.model_info.created_at
-                        # Ensure both datetimes have timezone info for comparison
-                        if created_at.tzinfo is None:
-                            created_at = created_at.replace(tzinfo=timezone.utc)
-                        if trend_date.tzinfo is None:
-                            trend_date = trend_date.replace(tzinfo=timezone.utc)
-
-                        if created_at <= trend_date:
-                            period_entries.append(entry)
-
-                if period_entries:
-                    # Calculate metrics for this period
-                    metrics = defaultdict(list)
-                    for entry in period_entries:
-                        for eval_result in entry.evaluation_results:
-                            metrics[eval_result.metric_name].append(eval_result.value)
+            # Roll the buckets forward so each monthly point accumulates every
+            # entry created at or before it
+            metrics = defaultdict(list)
+            model_count = 0
+            for month, bucket in enumerate(month_buckets):
+                for entry in bucket:
+                    model_count += 1
+                    for eval_result in entry.evaluation_results:
+                        metrics[eval_result.metric_name].append(eval_result.value)
 
+                if model_count:
+                    trend_date = start_date + timedelta(days=30 * month)
                     for metric_name, values in metrics.items():
                         if values:
+                            value_arr = np.fromiter(values, dtype=np.float64)
                             trend_data.append(TrendData(
                                 date=trend_date,
                                 task_type=task_type,
                                 metric_name=metric_name,
-                                avg_value=sum(values) / len(values),
-                                model_count=len(period_entries),
-                                best_value=max(values)
+                                avg_value=float(value_arr.mean()),
+                                model_count=model_count,
+                                best_value=float(value_arr.max())
                             ))
 
         return BenchmarkSummary(
@@ -697,65 +912,48 @@ class HuggingFaceDataFetcher:
             dataset_stats=dataset_stats,
             model_family_stats=model_family_stats,
             trend_data=trend_data,
-            last_updated=datetime.now(timezone.utc)
+            last_updated=end_date
         )
 
-    def compute_correlation_matrices(self, benchmark_entries: List[BenchmarkEntry]) -> List[CorrelationMatrix]:
+    def compute_correlation_matrices(self, benchmark_entries: List[BenchmarkEntry],
+                                     indexes: Optional[BenchmarkIndexes] = None) -> List[CorrelationMatrix]:
         """Compute correlation matrices for metrics by task type"""
-        correlations = []
-
-        # Group by task type
-        task_metrics = defaultdict(lambda: defaultdict(list))
-
-        for entry in benchmark_entries:
-            task_type = entry.model_info.task_type
-
-            # Collect all metrics for this model
-            model_metrics = {}
-            for eval_result in entry.evaluation_results:
-                model_metrics[eval_result.metric_name] = eval_result.value
+        if indexes is None:
+            indexes = self.build_indexes(benchmark_entries)
 
-            # Add to task metrics if we have multiple metrics
-            if len(model_metrics) >= 2:
-                for metric_name, value in model_metrics.items():
-                    task_metrics[task_type][metric_name].append(value)
+        correlations = []
 
         # Calculate correlations for each task
-        for task_type, metrics_dict in task_metrics.items():
+        for task_type, metrics_dict in indexes.task_metrics.items():
             # Filter metrics that have enough data points
             valid_metrics = {name: values for name, values in metrics_dict.items()
                            if len(values) >= 3}
 
             if len(valid_metrics) >= 2:
                 metric_names = list(valid_metrics.keys())
-                n_metrics = len(metric_names)
-
-                # Create correlation matrix
-                correlation_matrix = []
-                for i in range(n_metrics):
-                    row = []
-                    for j in range(n_metrics):
-                        if i == j:
-                            row.append(1.0)
-                        else:
-                            # Calculate Pearson correlation
-                            values1 = valid_metrics[metric_names[i]]
-                            values2 = valid_metrics[metric_names[j]]
-
-                            # Align lengths
-                            min_len = min(len(values1), len(values2))
-                            values1 = values1[:min_len]
-                            values2 = values2[:min_len]
-
-                            try:
-                                corr = np.corrcoef(values1, values2)[0, 1]
-                                if np.isnan(corr):
-                                    corr = 0.0
-                                row.append(round(corr, 3))
-                            except:
-                                row.append(0.0)
-
-                    correlation_matrix.append(row)
+
+                # Stack the metric series (truncated to a common length) and
+                # compute the full Pearson matrix in one vectorized call
+                min_len = min(map(len, valid_metrics.values()))
+                arr = np.asarray(
+                    [valid_metrics[name][:min_len] for name in metric_names],
+                    dtype=np.float64
+                )
+                # Pearson via one BLAS matmul: center the rows, then divide the
+                # Gram matrix by the outer product of the row norms. The stack
+                # is kept C-contiguous float64 so the matmul dispatches
+                # straight to dgemm without an internal copy.
+                arr = np.ascontiguousarray(arr)
+                centered = arr - arr.mean(axis=1, keepdims=True)
+                norms = np.sqrt((centered * centered).sum(axis=1))
+                norms[norms == 0] = 1.0
+                corr = (centered @ centered.T) / np.outer(norms, norms)
+                # A constant series has a zero centered row, which would put
+                # 0.0 on its own diagonal; self-correlation is 1.0 by
+                # definition
+                np.fill_diagonal(corr, 1.0)
+                corr = np.round(np.nan_to_num(corr, nan=0.0), 3)
+                correlation_matrix = corr.tolist()
 
                 correlations.append(CorrelationMatrix(
                     metrics=metric_names,
@@ -765,39 +963,42 @@ class HuggingFaceDataFetcher:
 
         return correlations
 
-    def generate_leaderboards(self, benchmark_entries: List[BenchmarkEntry]) -> List[Leaderboard]:
+    def generate_leaderboards(self, benchmark_entries: List[BenchmarkEntry],
+                              indexes: Optional[BenchmarkIndexes] = None) -> List[Leaderboard]:
         """Generate leaderboards for top performing models"""
-        leaderboards = []
-
-        # Group by task and dataset
-        task_dataset_models = defaultdict(lambda: defaultdict(list))
-
-        for entry in benchmark_entries:
-            task_type = entry.model_info.task_type
+        if indexes is None:
+            indexes = self.build_indexes(benchmark_entries)
 
-            for eval_result in entry.evaluation_results:
-                dataset_name = eval_result.dataset_name
-                task_dataset_models[task_type][dataset_name].append((entry, eval_result))
+        leaderboards = []
+        now = datetime.now(timezone.utc)
 
         # Create leaderboards for major task-dataset combinations
-        for task_type, dataset_dict in task_dataset_models.items():
+        for task_type, dataset_dict in indexes.task_dataset_results.items():
             for dataset_name, model_results in dataset_dict.items():
                 if len(model_results) >= 5:  # Only create leaderboards with sufficient entries
 
-                    # Group by model and find best metric for each
-                    model_best = {}
+                    # Index results by model so each entry can look up its
+                    # secondary metrics without re-scanning the whole dataset
+                    per_model_results = defaultdict(list)
+                    model_ids = []
                     for entry, eval_result in model_results:
-                        model_id = entry.model_info.model_id
-                        if model_id not in model_best or eval_result.value > model_best[model_id][1].value:
-                            model_best[model_id] = (entry, eval_result)
+                        model_ids.append(entry.model_info.model_id)
+                        per_model_results[entry.model_info.model_id].append(eval_result)
+
+                    # Best result per model via a single grouped argmax in C
+                    # instead of a Python dict-compare loop; idxmax keeps the
+                    # first occurrence on ties, matching the old strict ">"
+                    values = np.fromiter((r.value for _, r in model_results),
+                                         dtype=np.float64, count=len(model_results))
+                    best_indices = pd.Series(values).groupby(model_ids, sort=False).idxmax()
 
-                    # Sort by performance (descending)
-                    sorted_models = sorted(model_best.values(),
-                                         key=lambda x: x[1].value, reverse=True)
+                    # Top 20 by performance; nlargest beats a full sort here
+                    sorted_models = heapq.nlargest(20, (model_results[i] for i in best_indices),
+                                                   key=lambda x: x[1].value)
 
                     # Create leaderboard entries
                     entries = []
-                    for rank, (entry, primary_metric) in enumerate(sorted_models[:20], 1):  # Top 20
+                    for rank, (entry, primary_metric) in enumerate(sorted_models, 1):
 
                         # Calculate efficiency score (performance per parameter)
                         efficiency_score = None
@@ -805,11 +1006,11 @@ class HuggingFaceDataFetcher:
                             efficiency_score = primary_metric.value / (entry.model_info.parameter_count / 1e6)  # per million params
 
                         # Get other metrics for this model on this dataset
-                        secondary_metrics = []
-                        for _, eval_result in model_results:
-                            if (eval_result.dataset_name == dataset_name and
-                                eval_result != primary_metric):
-                                secondary_metrics.append(eval_result)
+                        secondary_metrics = [
+                            eval_result
+                            for eval_result in per_model_results[entry.model_info.model_id]
+                            if eval_result is not primary_metric
+                        ]
 
                         leaderboard_entry = LeaderboardEntry(
                             rank=rank,
@@ -826,143 +1027,116 @@ class HuggingFaceDataFetcher:
                             dataset_name=dataset_name,
                             metric_name=entries[0].primary_metric.metric_name,
                             entries=entries,
-                            last_updated=datetime.now(timezone.utc)
+                            last_updated=now
                         ))
 
         return leaderboards
 
-    async def _fetch_squad_benchmarks(self, session: aiohttp.ClientSession) -> List[BenchmarkEntry]:
+    async def _fetch_squad_benchmarks(self) -> List[BenchmarkEntry]:
         """Fetch SQuAD (Question Answering) benchmark results"""
-        async with session.get(f"{self.paperswithcode_url}/sota/question-answering-on-squad") as response:
-            if response.status != 200:
-                return []
-
-            data = await response.json()
-            entries = []
+        data = await self._get_pwc_json(f"{self.paperswithcode_url}/sota/question-answering-on-squad")
+        if data is None:
+            return []
 
-            for result in data.get("results", []):
-                model_name = result.get("model_name")
-                if not model_name:
-                    continue
+        entries = []
+        now = datetime.now(timezone.utc)
 
-                metrics = result.get("metrics", {})
-                em_score = metrics.get("exact_match", 0)
-                f1_score = metrics.get("f1", 0)
+        for result in data.get("results", []):
+            model_name = result.get("model_name")
+            if not model_name:
+                continue
 
-                if not (em_score or f1_score):
-                    continue
+            metrics = result.get("metrics", {})
+            em_score = metrics.get("exact_match", 0)
+            f1_score = metrics.get("f1", 0)
 
-                eval_results = []
-                if em_score:
-                    eval_results.append(EvaluationResult(
-                        metric_name="exact_match",
-                        metric_type=MetricType.EXACT_MATCH,
-                        value=float(em_score),
-                        dataset_name="SQuAD",
-                        dataset_split="test"
-                    ))
-                if f1_score:
-                    eval_results.append(EvaluationResult(
-                        metric_name="f1",
-                        metric_type=MetricType.F1,
-                        value=float(f1_score),
-                        dataset_name="SQuAD",
-                        dataset_split="test"
-                    ))
+            if not (em_score or f1_score):
+                continue
 
-                entries.append(BenchmarkEntry(
-                    model_info=ModelInfo(
-                        model_id=model_name,
-                        model_name=model_name,
-                        model_family=self._detect_model_family(model_name),
-                        task_type=TaskType.QUESTION_ANSWERING,
-                        created_at=datetime.now(timezone.utc),
-                        tags=["squad", "question-answering"]
-                    ),
-                    evaluation_results=eval_results,
-                    evaluated_at=datetime.now(timezone.utc)
+            eval_results = []
+            if em_score:
+                eval_results.append(EvaluationResult.model_construct(
+                    metric_name="exact_match",
+                    metric_type=MetricType.EXACT_MATCH,
+                    value=float(em_score),
+                    dataset_name="SQuAD",
+                    dataset_split="test"
+                ))
+            if f1_score:
+                eval_results.append(EvaluationResult.model_construct(
+                    metric_name="f1",
+                    metric_type=MetricType.F1,
+                    value=float(f1_score),
+                    dataset_name="SQuAD",
+                    dataset_split="test"
                 ))
 
-            return entries
+            entries.append(BenchmarkEntry.model_construct(
+                model_info=ModelInfo.model_construct(
+                    model_id=model_name,
+                    model_name=model_name,
+                    model_family=self._detect_model_family(model_name),
+                    task_type=TaskType.QUESTION_ANSWERING,
+                    created_at=now,
+                    tags=["squad", "question-answering"]
+                ),
+                evaluation_results=eval_results,
+                evaluated_at=now
+            ))
 
-    async def _fetch_wmt_benchmarks(self, session: aiohttp.ClientSession) -> List[BenchmarkEntry]:
+        return entries
+
+    async def _fetch_wmt_benchmarks(self) -> List[BenchmarkEntry]:
         """Fetch WMT (Translation) benchmark results"""
-        async with session.get(f"{self.paperswithcode_url}/sota/machine-translation-on-wmt2014-english-german") as response:
-            if response.status != 200:
-                return []
+        # The two language pairs are independent endpoints; fetch them together
+        ende, enfr = await asyncio.gather(
+            self._fetch_wmt("wmt2014-english-german", "en-de"),
+            self._fetch_wmt("wmt2014-english-french", "en-fr")
+        )
+        return ende + enfr
 
-            data = await response.json()
-            entries = []
+    async def _fetch_wmt(self, slug: str, config: str) -> List[BenchmarkEntry]:
+        """Fetch one WMT language-pair SOTA table"""
+        data = await self._get_pwc_json(f"{self.paperswithcode_url}/sota/machine-translation-on-{slug}")
+        if data is None:
+            return []
 
-            for result in data.get("results", []):
-                model_name = result.get("model_name")
-                if not model_name:
-                    continue
+        entries = []
+        now = datetime.now(timezone.utc)
 
-                metrics = result.get("metrics", {})
-                bleu_score = metrics.get("bleu", 0)
+        for result in data.get("results", []):
+            model_name = result.get("model_name")
+            if not model_name:
+                continue
 
-                if not bleu_score:
-                    continue
+            bleu_score = result.get("metrics", {}).get("bleu", 0)
+            if not bleu_score:
+                continue
 
-                entries.append(BenchmarkEntry(
-                    model_info=ModelInfo(
-                        model_id=model_name,
-                        model_name=model_name,
-                        model_family=self._detect_model_family(model_name),
-                        task_type=TaskType.TRANSLATION,
-                        created_at=datetime.now(timezone.utc),
-                        tags=["wmt", "translation", "en-de"]
-                    ),
-                    evaluation_results=[
-                        EvaluationResult(
-                            metric_name="bleu",
-                            metric_type=MetricType.BLEU,
-                            value=float(bleu_score),
-                            dataset_name="WMT14",
-                            dataset_config="en-de",
-                            dataset_split="test"
-                        )
-                    ],
-                    evaluated_at=datetime.now(timezone.utc)
-                ))
+            entries.append(BenchmarkEntry.model_construct(
+                model_info=ModelInfo.model_construct(
+                    model_id=model_name,
+                    model_name=model_name,
+                    model_family=self._detect_model_family(model_name),
+                    task_type=TaskType.TRANSLATION,
+                    created_at=now,
+                    tags=["wmt", "translation", config]
+                ),
+                evaluation_results=[
+                    EvaluationResult.model_construct(
+                        metric_name="bleu",
+                        metric_type=MetricType.BLEU,
+                        value=float(bleu_score),
+                        dataset_name="WMT14",
+                        dataset_config=config,
+                        dataset_split="test"
+                    )
+                ],
+                evaluated_at=now
+            ))
 
-            # Also fetch English-French results
-            async with session.get(f"{self.paperswithcode_url}/sota/machine-translation-on-wmt2014-english-french") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    for result in data.get("results", []):
-                        model_name = result.get("model_name")
-                        if not model_name:
-                            continue
-
-                        bleu_score = result.get("metrics", {}).get("bleu", 0)
-                        if not bleu_score:
-                            continue
-
-                        entries.append(BenchmarkEntry(
-                            model_info=ModelInfo(
-                                model_id=model_name,
-                                model_name=model_name,
-                                model_family=self._detect_model_family(model_name),
-                                task_type=TaskType.TRANSLATION,
-                                created_at=datetime.now(timezone.utc),
-                                tags=["wmt", "translation", "en-fr"]
-                            ),
-                            evaluation_results=[
-                                EvaluationResult(
-                                    metric_name="bleu",
-                                    metric_type=MetricType.BLEU,
-                                    value=float(bleu_score),
-                                    dataset_name="WMT14",
-                                    dataset_config="en-fr",
-                                    dataset_split="test"
-                                )
-                            ],
-                            evaluated_at=datetime.now(timezone.utc)
-                        ))
+        return entries
 
-            return entries
 
 
 
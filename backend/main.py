@@ -1,8 +1,11 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+import orjson
 import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 import uvicorn
@@ -23,7 +26,8 @@ app = FastAPI(
     description="API for machine learning benchmark visualization and analytics",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -35,25 +39,64 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global cache for benchmark data
-benchmark_cache = {
-    "data": None,
-    "last_updated": None,
-    "ttl_minutes": 60  # Cache for 1 hour
-}
+CACHE_TTL_MINUTES = 60  # Cache for 1 hour
+
+
+@dataclass(frozen=True)
+class CacheSnapshot:
+    """Immutable result of one refresh, swapped in with a single reference store.
+
+    Readers grab the current snapshot once and use it throughout a request, so
+    an in-flight refresh can never hand them data from one refresh and a
+    timestamp from another.
+    """
+    data: BenchmarkResponse
+    # Pre-serialized JSON served by /api/benchmarks, split per top-level
+    # section so the response streams without assembling one large blob
+    body_chunks: tuple
+    last_updated: datetime  # Wall-clock time, for /api/cache-status display
+    expires_at: float  # time.monotonic() deadline, immune to clock jumps
+
+
+# Current snapshot; replaced atomically by refresh_cache, never mutated
+_snapshot: Optional[CacheSnapshot] = None
 
 
 def is_cache_valid() -> bool:
     """Check if the cached data is still valid"""
-    if benchmark_cache["data"] is None or benchmark_cache["last_updated"] is None:
-        return False
+    snapshot = _snapshot
+    return snapshot is not None and snapshot.expires_at > time.monotonic()
 
-    time_diff = datetime.utcnow() - benchmark_cache["last_updated"]
-    return time_diff.total_seconds() < (benchmark_cache["ttl_minutes"] * 60)
+
+# In-flight refresh, if any; concurrent callers await it instead of starting
+# their own full fetch/compute pass
+_refresh_inflight: Optional[asyncio.Future] = None
 
 
 async def refresh_cache():
-    """Refresh the benchmark data cache"""
+    """Refresh the benchmark data cache, coalescing concurrent callers
+
+    A cold start or a burst of force_refresh requests would otherwise kick off
+    one full HTTP fan-out per caller; everyone arriving while a refresh is
+    running awaits the same future instead.
+    """
+    global _refresh_inflight
+    inflight = _refresh_inflight
+    if inflight is not None and not inflight.done():
+        await inflight
+        return
+
+    inflight = asyncio.ensure_future(_do_refresh())
+    _refresh_inflight = inflight
+    try:
+        await inflight
+    finally:
+        _refresh_inflight = None
+
+
+async def _do_refresh():
+    """Fetch fresh benchmark data and publish a new cache snapshot"""
+    global _snapshot
     try:
         logger.info("Starting cache refresh...")
 
@@ -65,19 +108,33 @@ async def refresh_cache():
                 logger.warning("No benchmark entries fetched")
                 return
 
-            # Compute statistics
-            summary = fetcher.compute_summary_statistics(benchmark_entries)
-            correlations = fetcher.compute_correlation_matrices(benchmark_entries)
-            leaderboards = fetcher.generate_leaderboards(benchmark_entries)
+            # Compute statistics off one shared pass over the entries
+            indexes = fetcher.build_indexes(benchmark_entries)
+            summary = fetcher.compute_summary_statistics(benchmark_entries, indexes)
+            correlations = fetcher.compute_correlation_matrices(benchmark_entries, indexes)
+            leaderboards = fetcher.generate_leaderboards(benchmark_entries, indexes)
 
-            # Update cache
-            benchmark_cache["data"] = BenchmarkResponse(
+            # Build the full snapshot off to the side, then publish it with
+            # one reference store; readers keep serving the old one meanwhile
+            response = BenchmarkResponse(
                 data=benchmark_entries,
                 summary=summary,
                 correlations=correlations,
                 leaderboards=leaderboards
             )
-            benchmark_cache["last_updated"] = datetime.utcnow()
+            dump = response.model_dump(mode="json")
+            _snapshot = CacheSnapshot(
+                data=response,
+                body_chunks=(
+                    b'{"data":', orjson.dumps(dump["data"]),
+                    b',"summary":', orjson.dumps(dump["summary"]),
+                    b',"correlations":', orjson.dumps(dump["correlations"]),
+                    b',"leaderboards":', orjson.dumps(dump["leaderboards"]),
+                    b'}',
+                ),
+                last_updated=datetime.utcnow(),
+                expires_at=time.monotonic() + CACHE_TTL_MINUTES * 60
+            )
 
             logger.info(f"Cache refreshed successfully with {len(benchmark_entries)} entries")
 
@@ -126,7 +183,7 @@ async def health_check():
     )
 
 
-@app.get("/api/benchmarks", response_model=BenchmarkResponse)
+@app.get("/api/benchmarks")
 async def get_benchmarks(force_refresh: bool = False):
     """
     Get ML benchmark data with comprehensive analytics
@@ -138,13 +195,19 @@ async def get_benchmarks(force_refresh: bool = False):
         if force_refresh or not is_cache_valid():
             await refresh_cache()
 
-        if benchmark_cache["data"] is None:
+        snapshot = _snapshot
+        if snapshot is None:
             raise HTTPException(
                 status_code=503,
                 detail="Benchmark data is not available. Please try again later."
             )
 
-        return benchmark_cache["data"]
+        # Serve the bytes produced at refresh time; headers flush after the
+        # first chunk instead of waiting on one multi-megabyte blob
+        return StreamingResponse(
+            iter(snapshot.body_chunks),
+            media_type="application/json"
+        )
 
     except Exception as e:
         logger.error(f"Error in get_benchmarks: {e}")
@@ -177,12 +240,13 @@ async def refresh_benchmarks(background_tasks: BackgroundTasks):
 @app.get("/api/cache-status")
 async def get_cache_status():
     """Get information about the current cache status"""
+    snapshot = _snapshot
     return {
         "cache_valid": is_cache_valid(),
-        "last_updated": benchmark_cache["last_updated"],
-        "ttl_minutes": benchmark_cache["ttl_minutes"],
-        "has_data": benchmark_cache["data"] is not None,
-        "data_count": len(benchmark_cache["data"].data) if benchmark_cache["data"] else 0
+        "last_updated": snapshot.last_updated if snapshot else None,
+        "ttl_minutes": CACHE_TTL_MINUTES,
+        "has_data": snapshot is not None,
+        "data_count": len(snapshot.data.data) if snapshot else 0
     }
 
 
@@ -204,27 +268,29 @@ async def global_exception_handler(request, exc):
 @app.middleware("http")
 async def log_requests(request, call_next):
     """Log all HTTP requests"""
-    from datetime import timezone
-    start_time = datetime.now(timezone.utc)
+    # Skip the timing work entirely when INFO logging is off
+    if not logger.isEnabledFor(logging.INFO):
+        return await call_next(request)
+
+    start_time = time.perf_counter_ns()
 
     try:
         # Process the request
         response = await call_next(request)
 
         # Calculate processing time
-        process_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+        process_time = (time.perf_counter_ns() - start_time) / 1e9
 
-        # Log the request
+        # %-style args defer formatting until the log record is emitted
         logger.info(
-            f"{request.method} {request.url.path} - "
-            f"Status: {response.status_code} - "
-            f"Time: {process_time:.3f}s"
+            "%s %s - Status: %d - Time: %.3fs",
+            request.method, request.url.path, response.status_code, process_time
         )
 
         return response
     except Exception as e:
         # Log the error and re-raise
-        logger.error(f"Request processing error: {e}")
+        logger.error("Request processing error: %s", e)
         raise
 
 
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 from enum import Enum
@@ -82,6 +82,10 @@ class ModelFamily(str, Enum):
 
 
 class EvaluationResult(BaseModel):
+    # Instantiated thousands of times per refresh and cached for an hour;
+    # frozen instances hash/share safely and skip assignment validation
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     metric_name: str = Field(..., description="Name of the evaluation metric")
     metric_type: MetricType = Field(..., description="Type of the metric")
     value: float = Field(..., description="Metric value", ge=0)
@@ -91,6 +95,8 @@ class EvaluationResult(BaseModel):
 
 
 class ModelInfo(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     model_id: str = Field(..., description="Unique model identifier")
     model_name: str = Field(..., description="Human-readable model name")
     model_family: ModelFamily = Field(..., description="Model architecture family")
@@ -108,6 +114,8 @@ class ModelInfo(BaseModel):
 
 
 class BenchmarkEntry(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     model_info: ModelInfo = Field(..., description="Information about the model")
     evaluation_results: List[EvaluationResult] = Field(..., description="List of evaluation results")
     evaluated_at: Optional[datetime] = Field(None, description="When the evaluation was performed")
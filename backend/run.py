@@ -6,62 +6,184 @@ This script starts the FastAPI server for the ML Benchmark visualization applica
 It handles environment setup, logging configuration, and server initialization.
 """
 
+import copy
 import os
+import queue
 import sys
-import uvicorn
 import logging
-from pathlib import Path
+from dataclasses import dataclass
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from typing import Optional
 
-# Add the backend directory to Python path
-backend_dir = Path(__file__).parent
-sys.path.insert(0, str(backend_dir))
+import orjson
 
-# Configure logging
+# Add the backend directory to Python path (guarded: a duplicate entry would
+# lengthen every subsequent import lookup)
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+# Log records only get enqueued on the hot path; a listener thread owns the
+# real handlers, so request handlers never block on stdout or disk writes
+_log_queue = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('ml_benchmark_api.log')
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 
 logger = logging.getLogger(__name__)
 
+
+class _JsonAccessFormatter(logging.Formatter):
+    """Serialize uvicorn access records straight to JSON lines with orjson,
+    skipping the default formatter's %-tokenization per request"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        client_addr, method, path, http_version, status_code = record.args
+        return orjson.dumps({
+            "time": record.created,
+            "client": client_addr,
+            "method": method,
+            "path": path,
+            "http_version": http_version,
+            "status": status_code,
+        }).decode()
+
+
+def _build_json_log_config(base_config: dict) -> dict:
+    """Swap uvicorn's access formatter for the JSON one, keeping the rest"""
+    log_config = copy.deepcopy(base_config)
+    log_config["formatters"]["access"] = {"()": _JsonAccessFormatter}
+    return log_config
+
+
+@dataclass(frozen=True)
+class ServerConfig:
+    """Server settings parsed from the environment exactly once
+
+    frozen keeps the instance immutable, so it can be shared between the
+    reloader master and its children without copying.
+    """
+    host: str
+    port: int
+    reload: bool
+    workers: int
+    log_level: str
+    access_log: bool
+    log_json: bool
+    # Optional UNIX domain socket for same-host reverse proxies; when set it
+    # takes precedence over host/port and skips the TCP loopback path
+    uds: Optional[str]
+
+    @classmethod
+    def from_env(cls) -> "ServerConfig":
+        return cls(
+            host=os.getenv("HOST", "0.0.0.0"),
+            port=int(os.getenv("PORT", "8000")),
+            reload=os.getenv("RELOAD", "true").lower() == "true",
+            workers=int(os.getenv("WORKERS", "1")),
+            log_level=os.getenv("LOG_LEVEL", "info"),
+            access_log=os.getenv("ACCESS_LOG", "true").lower() == "true",
+            log_json=os.getenv("LOG_JSON", "false").lower() == "true",
+            uds=os.getenv("UDS"),
+        )
+
+
+def _start_log_listener() -> QueueListener:
+    """Drain the log queue to its sinks on a background thread
+
+    Stdout is the only default sink: under systemd or Docker it already lands
+    in the journal / container log, and a file copy would just double the I/O.
+    LOG_TO_FILE=true adds the log file back, batched through a MemoryHandler
+    so the disk sees one write per 32 records instead of one per record;
+    errors flush immediately, and shutdown flushes the remainder via close().
+    """
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if os.getenv("LOG_TO_FILE", "false").lower() == "true":
+        handlers.append(MemoryHandler(
+            capacity=32,
+            flushLevel=logging.ERROR,
+            target=logging.FileHandler('ml_benchmark_api.log')
+        ))
+    listener = QueueListener(_log_queue, *handlers)
+    listener.start()
+    return listener
+
+
+# Started at import, not in main(): uvicorn's reload and multi-worker modes
+# spawn children that re-execute this module level (as __mp_main__) with a
+# fresh queue, so each process must drain its own queue or its application
+# logs are silently swallowed. The listener thread is daemonic and does not
+# keep child processes alive.
+_log_listener = _start_log_listener()
+
 def main():
     """Main function to start the FastAPI server"""
+    listener = _log_listener
+
+    # Server configuration, parsed from the environment in one shot
+    config = ServerConfig.from_env()
 
-    # Server configuration
-    host = os.getenv("HOST", "0.0.0.0")
-    port = int(os.getenv("PORT", "8000"))
-    reload = os.getenv("RELOAD", "true").lower() == "true"
-    workers = int(os.getenv("WORKERS", "1"))
+    # uvloop and httptools (shipped with uvicorn[standard]) replace the stdlib
+    # selector loop and the pure-Python h11 parser; both are POSIX-only, so
+    # fall back to uvicorn's auto-detection on Windows
+    loop = "uvloop" if sys.platform != "win32" else "auto"
+    http = "httptools" if sys.platform != "win32" else "auto"
+    # ANSI color wrapping is wasted work when stdout is a pipe (Docker, CI)
+    use_colors = sys.stdout.isatty()
 
     logger.info("Starting ML Benchmark API Server...")
-    logger.info(f"Host: {host}")
-    logger.info(f"Port: {port}")
-    logger.info(f"Reload: {reload}")
-    logger.info(f"Workers: {workers}")
+    if config.uds:
+        logger.info(f"Socket: {config.uds}")
+    else:
+        logger.info(f"Host: {config.host}")
+        logger.info(f"Port: {config.port}")
+    logger.info(f"Reload: {config.reload}")
+    logger.info(f"Workers: {config.workers}")
+
+    # Deferred: uvicorn pulls in a large import graph, so bring it in only
+    # once configuration has been read and logged
+    import uvicorn
+    from uvicorn.config import LOGGING_CONFIG
+
+    # LOG_JSON=true emits access lines as orjson-serialized JSON instead of
+    # running the default %-style access formatter per request
+    if config.log_json:
+        log_config = _build_json_log_config(LOGGING_CONFIG)
+    else:
+        log_config = LOGGING_CONFIG
 
     try:
         # Start the server with better configuration
         uvicorn.run(
             "main:app",
-            host=host,
-            port=port,
-            reload=reload,
-            workers=workers if not reload else 1,  # Can't use workers with reload
-            log_level="info",
-            access_log=True,
-            reload_includes=["*.py"] if reload else None,
-            reload_excludes=["__pycache__", "*.pyc", ".git", "venv", ".venv"] if reload else None,
-            use_colors=True
+            host=config.host,
+            port=config.port,
+            uds=config.uds,
+            reload=config.reload,
+            workers=config.workers if not config.reload else 1,  # Can't use workers with reload
+            log_level=config.log_level,
+            access_log=config.access_log,
+            log_config=log_config,
+            loop=loop,
+            http=http,
+            # Watch only the backend tree; with watchfiles (bundled in
+            # uvicorn[standard]) this is one inotify watch instead of
+            # stat-polling the whole working directory
+            reload_dirs=[backend_dir] if config.reload else None,
+            use_colors=use_colors
         )
     except KeyboardInterrupt:
         logger.info("Server shutdown requested by user")
     except Exception as e:
         logger.error(f"Server error: {e}")
         sys.exit(1)
+    finally:
+        # Flush anything still queued or batched before the process exits
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
 
 if __name__ == "__main__":
     main()
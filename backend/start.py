@@ -4,14 +4,68 @@ Simple startup script for ML Benchmark API
 This script provides a more stable way to start the development server
 """
 
-import uvicorn
 import sys
 import os
-from pathlib import Path
 
-# Add the backend directory to Python path
-backend_dir = Path(__file__).parent
-sys.path.insert(0, str(backend_dir))
+# Add the backend directory to Python path (guarded: a duplicate entry would
+# lengthen every subsequent import lookup)
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+# Static banner pieces, built once at import instead of per main() call
+_BANNER_HEADER = "🚀 Starting ML Benchmark API Server..."
+_DASH = "-" * 50
+
+
+def _run_reuseport_worker(config):
+    """Serve on a private SO_REUSEPORT socket so this worker owns its own
+    accept queue; the kernel hashes incoming connections across workers"""
+    import socket
+    import uvicorn
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((config["host"], config["port"]))
+
+    uvicorn.run(
+        config["app"],
+        fd=sock.fileno(),
+        log_level="warning",
+        access_log=False,
+        use_colors=config["use_colors"],
+        loop=config["loop"],
+        http=config["http"],
+    )
+
+
+def _build_uvicorn_argv(config):
+    """Translate the config dict into uvicorn CLI arguments"""
+    argv = [config["app"]]
+    if "uds" in config:
+        argv += ["--uds", config["uds"]]
+    else:
+        argv += ["--host", config["host"], "--port", str(config["port"])]
+    argv += [
+        "--log-level", config["log_level"],
+        "--loop", config["loop"],
+        "--http", config["http"],
+        "--access-log" if config["access_log"] else "--no-access-log",
+        "--use-colors" if config["use_colors"] else "--no-use-colors",
+    ]
+    if config.get("reload"):
+        argv.append("--reload")
+        for reload_dir in config.get("reload_dirs", []):
+            argv += ["--reload-dir", reload_dir]
+        for pattern in config.get("reload_includes", []):
+            argv += ["--reload-include", pattern]
+        for pattern in config.get("reload_excludes", []):
+            argv += ["--reload-exclude", pattern]
+    elif config.get("workers"):
+        argv += ["--workers", str(config["workers"])]
+    return argv
+
 
 def main():
     """Start the FastAPI server with optimized settings"""
@@ -23,14 +77,29 @@ def main():
         "port": 8000,
         "log_level": "info",
         "access_log": True,
-        "use_colors": True,
+        # Colorize only when stdout is a real terminal
+        "use_colors": sys.stdout.isatty(),
+        # Prefer the uvloop event loop and httptools parser; POSIX-only, so
+        # let uvicorn auto-detect on Windows
+        "loop": "uvloop" if sys.platform != "win32" else "auto",
+        "http": "httptools" if sys.platform != "win32" else "auto",
     }
 
+    # Behind a same-host reverse proxy (nginx: proxy_pass http://unix:<path>;)
+    # a UNIX domain socket skips the TCP loopback path entirely
+    uds = os.getenv("UDS")
+    if uds:
+        del config["host"], config["port"]
+        config["uds"] = uds
+        address = f"unix:{uds}"
+    else:
+        address = f"http://{config['host']}:{config['port']}"
+
     # Development vs Production settings
     if os.getenv("ENV", "development") == "development":
         config.update({
             "reload": True,
-            "reload_dirs": [str(backend_dir)],
+            "reload_dirs": [backend_dir],
             "reload_includes": ["*.py"],
             "reload_excludes": [
                 "__pycache__/*",
@@ -45,22 +114,68 @@ def main():
             "workers": 1  # Must be 1 for reload
         })
     else:
-        config.update({
-            "reload": False,
-            "workers": 4
-        })
+        workers = int(os.getenv("WORKERS", "4"))
+
+        if uds:
+            # A UNIX socket has a single accept queue, so reuseport sharding
+            # does not apply; keep the gunicorn --preload handoff (app is
+            # imported once in the master and forked copy-on-write into
+            # workers). Production stays at warnings only: per-request access
+            # logging is synchronous stdlib logging and measurably caps
+            # throughput.
+            print(f"🚀 Starting ML Benchmark API Server (gunicorn, {workers} workers)...")
+            # The exec'd server resolves main:app from its cwd; the parent's
+            # sys.path entry does not survive the exec
+            os.chdir(backend_dir)
+            os.execvp("gunicorn", [
+                "gunicorn", "main:app",
+                "--worker-class", "uvicorn.workers.UvicornWorker",
+                "--workers", str(workers),
+                "--preload",
+                "--bind", f"unix:{uds}",
+                "--log-level", "warning",
+            ])
+
+        # TCP production: give every worker its own SO_REUSEPORT socket so
+        # the kernel spreads connections across N independent accept queues
+        # instead of funneling all workers through one inherited listener
+        import multiprocessing
+
+        print(f"🚀 Starting ML Benchmark API Server ({workers} reuseport workers)...")
+        cpu_count = os.cpu_count() or 1
+        processes = []
+        for index in range(workers):
+            process = multiprocessing.Process(target=_run_reuseport_worker, args=(config,))
+            process.start()
+            # Pin each worker to one core (Linux only) so the event loop and
+            # its hot frame/cache state stop migrating between CPUs
+            if hasattr(os, "sched_setaffinity"):
+                os.sched_setaffinity(process.pid, {index % cpu_count})
+            processes.append(process)
+        for process in processes:
+            process.join()
+        return
 
-    print("🚀 Starting ML Benchmark API Server...")
-    print(f"📍 Server will be available at: http://{config['host']}:{config['port']}")
-    print(f"📚 API Documentation: http://{config['host']}:{config['port']}/docs")
-    print(f"🔄 Reload enabled: {config.get('reload', False)}")
-    print("-" * 50)
+    # One buffered write instead of five line-flushed prints
+    banner = "\n".join([
+        _BANNER_HEADER,
+        f"📍 Server will be available at: {address}",
+        f"📚 API Documentation: {address}/docs",
+        f"🔄 Reload enabled: {config.get('reload', False)}",
+        _DASH,
+    ])
+    sys.stdout.write(banner + "\n")
+    sys.stdout.flush()
 
+    # Replace this bootstrap process with uvicorn itself, mirroring the
+    # gunicorn handoff above: the env parsing and banner machinery are freed
+    # instead of living on as a parent supervisor for the life of the server
     try:
-        uvicorn.run(**config)
-    except KeyboardInterrupt:
-        print("\n🛑 Server shutdown requested by user")
-    except Exception as e:
+        # As above: the exec'd uvicorn resolves main:app from its cwd
+        os.chdir(backend_dir)
+        os.execvp(sys.executable,
+                  [sys.executable, "-m", "uvicorn"] + _build_uvicorn_argv(config))
+    except OSError as e:
         print(f"❌ Server error: {e}")
         sys.exit(1)
 